@@ -2,7 +2,6 @@ from __future__ import annotations
 from typing import Optional, Dict, Any, List
 import threading
 import time
-import re
 from datetime import datetime
 
 from sqlmodel import select
@@ -10,13 +9,7 @@ from ..storage.db import get_session
 from ..storage.models import NormalizedNews, IntradayEvent
 from ..util_time import get_market_open_naive_local, get_market_close_naive_local
 from ..config import get_config
-
-
-_NEGATIVE_PATTERNS = [
-    r"\bdown\b", r"\bfall\b", r"\bloss\b", r"\bwarn\w*\b",
-    r"监管", r"处罚", r"罚款", r"预警", r"下跌", r"亏损",
-]
-_NEG_RE = re.compile("|".join(_NEGATIVE_PATTERNS), flags=re.IGNORECASE)
+from ..rules import is_negative_alert
 
 
 _state_lock = threading.Lock()
@@ -40,7 +33,7 @@ def _tick(market: str, trade_date: str, interval_minutes: int) -> None:
                     title = (r.title or "")
                     if not title:
                         continue
-                    if _NEG_RE.search(title):
+                    if is_negative_alert(title):
                         ev = IntradayEvent(
                             trade_date=trade_date,
                             market=market,
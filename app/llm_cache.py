@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 import threading
 import hashlib
 import json
@@ -15,8 +15,25 @@ _STATS = {
 	"hits": 0,
 	"misses": 0,
 	"size": 0,
+	"coalesced": 0,
 }
 
+T = TypeVar("T")
+
+
+class _Flight:
+	"""One in-flight upstream call; followers wait on `event` for its outcome."""
+	__slots__ = ("event", "result", "error")
+
+	def __init__(self) -> None:
+		self.event = threading.Event()
+		self.result: Any = None
+		self.error: Optional[BaseException] = None
+
+
+# In-flight calls keyed by cache key (single-flight coalescing)
+_INFLIGHT: Dict[str, _Flight] = {}
+
 
 def make_cache_key(provider: str, model: Optional[str], temperature: Optional[float], max_tokens: Optional[int], messages: Any) -> str:
 	try:
@@ -88,6 +105,38 @@ def cache_set(key: str, value: Any, ttl_seconds: Optional[int] = None) -> None:
 		_STATS["size"] = len(_CACHE)
 
 
+def single_flight(key: str, fn: Callable[[], T], timeout_s: Optional[float] = None) -> Tuple[T, bool]:
+	"""Run `fn` at most once per key among concurrent callers.
+	The first caller (leader) executes `fn`; callers arriving while it is in flight
+	wait up to their own `timeout_s` and receive the leader's result or exception.
+	Returns (result, coalesced) where coalesced is True for followers.
+	"""
+	with _LOCK:
+		flight = _INFLIGHT.get(key)
+		leader = flight is None
+		if flight is None:
+			flight = _Flight()
+			_INFLIGHT[key] = flight
+		else:
+			_STATS["coalesced"] = int(_STATS.get("coalesced", 0)) + 1
+	if leader:
+		try:
+			flight.result = fn()
+			return flight.result, False
+		except BaseException as e:
+			flight.error = e
+			raise
+		finally:
+			with _LOCK:
+				_INFLIGHT.pop(key, None)
+			flight.event.set()
+	if not flight.event.wait(timeout=timeout_s):
+		raise TimeoutError(f"timed out waiting for in-flight call {key[:12]}")
+	if flight.error is not None:
+		raise flight.error
+	return flight.result, True
+
+
 def cache_stats() -> Dict[str, int]:
 	with _LOCK:
 		return {
@@ -95,6 +144,8 @@ def cache_stats() -> Dict[str, int]:
 			"hits": int(_STATS.get("hits", 0)),
 			"misses": int(_STATS.get("misses", 0)),
 			"size": int(_STATS.get("size", 0)),
+			"coalesced": int(_STATS.get("coalesced", 0)),
+			"inflight": len(_INFLIGHT),
 		}
 
 
@@ -104,4 +155,5 @@ def cache_clear() -> None:
 		_STATS["puts"] = 0
 		_STATS["hits"] = 0
 		_STATS["misses"] = 0
-		_STATS["size"] = 0 
\ No newline at end of file
+		_STATS["size"] = 0
+		_STATS["coalesced"] = 0 
\ No newline at end of file
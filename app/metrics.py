@@ -12,7 +12,7 @@ _totals: Dict[str, Any] = {
 	"last": None,
 	"success": 0,
 	"failure": 0,
-	"llm": {"calls": 0, "success": 0, "failure": 0, "cache_hits": 0, "latencies_ms": [], "ttft_ms": []},
+	"llm": {"calls": 0, "success": 0, "failure": 0, "cache_hits": 0, "coalesced": 0, "latencies_ms": [], "ttft_ms": []},
 }
 
 
@@ -27,12 +27,15 @@ def record_run(run_metrics: Dict[str, Any]) -> None:
 			_totals["success"] = int(_totals.get("success", 0)) + 1
 
 
-def record_llm_call(outcome: str, duration_ms: int, cache_hit: bool, ttft_ms: Optional[int] = None) -> None:
+def record_llm_call(outcome: str, duration_ms: int, cache_hit: bool, ttft_ms: Optional[int] = None, coalesced: bool = False) -> None:
 	with _lock:
 		m = _totals.get("llm") or {}
 		m["calls"] = int(m.get("calls", 0)) + 1
 		if cache_hit:
 			m["cache_hits"] = int(m.get("cache_hits", 0)) + 1
+		if coalesced:
+			# waited on another caller's in-flight upstream call (not a cache hit)
+			m["coalesced"] = int(m.get("coalesced", 0)) + 1
 		if outcome == "success":
 			m["success"] = int(m.get("success", 0)) + 1
 		else:
@@ -112,6 +115,7 @@ def snapshot() -> Dict[str, Any]:
 				"success": llm_tot.get("success", 0),
 				"failure": llm_tot.get("failure", 0),
 				"cache_hits": llm_tot.get("cache_hits", 0),
+				"coalesced": llm_tot.get("coalesced", 0),
 				"latency_ms": llm_p,
 				"ttft_ms": llm_ttft_p,
 				"cache": cache_stats,
@@ -129,5 +133,5 @@ def reset() -> None:
 			"last": None,
 			"success": 0,
 			"failure": 0,
-			"llm": {"calls": 0, "success": 0, "failure": 0, "cache_hits": 0, "latencies_ms": [], "ttft_ms": []},
+			"llm": {"calls": 0, "success": 0, "failure": 0, "cache_hits": 0, "coalesced": 0, "latencies_ms": [], "ttft_ms": []},
 		}) 
\ No newline at end of file
@@ -133,6 +133,7 @@ class MetricsSnapshotResponse(BaseModel):
     last_diversity: Optional[Dict[str, Any]] = None
     last_source_diversity: Optional[Dict[str, Any]] = None
     last_http_cache: Optional[Dict[str, Any]] = None
+    llm: Optional[Dict[str, Any]] = None
 
 
 class AlertItem(BaseModel):
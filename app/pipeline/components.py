@@ -285,19 +285,12 @@ def normalize(items: List[RawItem]) -> List[NormalizedItem]:
 
 
 def simple_rule_tags(n: NormalizedItem) -> Tuple[float, float]:
-	"""Returns (event_weight, sentiment_strength) with trivial rules.
-	- event_weight: +0.8 if keyword like 'earnings'/'contract' in title, else 0.5
-	- sentiment_strength: 0.6 if 'up'/'surge' in title, 0.4 if 'down'/'fall', else 0.5
+	"""Returns (event_weight, sentiment_strength) from the shared keyword rule engine.
+	- event_weight: 0.8 if any event keyword (earnings/contract/m&a/guidance) hits, else 0.5
+	- sentiment_strength: 0.6 on positive keywords, 0.4 on negative, else 0.5
 	"""
-	title = (n.title or "").lower()
-	event_weight = 0.8 if any(k in title for k in ("earnings", "contract", "merger", "m\u0026a")) else 0.5
-	if any(k in title for k in ("up", "surge", "beat", "win")):
-		sentiment_strength = 0.6
-	elif any(k in title for k in ("down", "fall", "miss", "loss")):
-		sentiment_strength = 0.4
-	else:
-		sentiment_strength = 0.5
-	return event_weight, sentiment_strength
+	from ..rules import rule_scores
+	return rule_scores(n.title)
 
 
 def compute_recency(published_at: Optional[str], as_of_iso: Optional[str]) -> float:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 from datetime import datetime, timezone
-from typing import Dict, Any, Callable, Optional
+from typing import Dict, Any, Callable, List, Optional
 from ..models import DeadlinesSpec
 from ..util_time import get_market_open_naive_local, compute_deadlines
 import json
@@ -44,7 +44,7 @@ class PreOpenPipeline:
 			from ..config import get_config
 			from .components import fetch_from_all_sources, normalize, score_items, select_top_n, generate_plan, make_dedup_key, detect_language_fast
 			from ..storage import get_session, RawNews, NormalizedNews, Score, TopCandidate, TradePlan
-			from sqlmodel import select
+			from ..storage import bulk_insert, insert_ignore_returning
 		except Exception:
 			# Storage or components not available; return metadata only
 			return result
@@ -99,7 +99,8 @@ class PreOpenPipeline:
 			pre_src = Counter((getattr(getattr(s, "normalized", None), "source_id", "") or "") for s in scored_items)
 			post_src = Counter((getattr(getattr(s, "normalized", None), "source_id", "") or "") for s in topn)
 
-			# Metrics snapshot
+			# Metrics snapshot (recorded after persistence so the persist stage is included)
+			run_metrics: Optional[Dict[str, Any]] = None
 			try:
 				uniq_keys = len({make_dedup_key(getattr(r, "url", None), getattr(r, "title", None)) for r in raw_items})
 				ingested = len(raw_items)
@@ -155,118 +156,123 @@ class PreOpenPipeline:
 					"source_diversity": {"pre": dict(pre_src), "post": dict(post_src)},
 					"http_cache": http_cache,
 				}
-				record_run(metrics)
+				run_metrics = metrics
 			except Exception:
 				pass
 
-			with get_session() as session:
-				# Persist raw and normalized
-				for r in raw_items:
-					key = make_dedup_key(getattr(r, "url", None), getattr(r, "title", None))
-					lang = detect_language_fast((getattr(r, "title", None) or "") + " " + (getattr(r, "url", None) or ""))
-					content = (getattr(r, "title", None) or "") + "|" + (getattr(r, "url", None) or "")
-					hash_val = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
-					# Skip insert if duplicate already exists for this source
-					exists = session.exec(
-						select(RawNews).where(
-							RawNews.source_id == (getattr(r, "source_id", None) or "demo"),
-							RawNews.dedup_key == key,
-						)
-					).first()
-					if exists:
-						continue
-					rn = RawNews(
-						source_id=(getattr(r, "source_id", None) or "demo"),
-						url=getattr(r, "url", None),
-						title=getattr(r, "title", None),
-						published_at=getattr(r, "published_at", None),
-						fetched_at=as_of,
-						hash=hash_val,
-						dedup_key=key,
-						lang=lang,
-					)
-					session.add(rn)
-					session.commit()
-					session.refresh(rn)
+			t_persist0 = time.time()
+			raw_ids: Dict[Any, int] = {}
+			try:
+				with get_session() as session:
+					# Persist raw and normalized in one transaction with multi-row INSERTs.
+					# Raw dedup relies on the unique (source_id, dedup_key) index (ON CONFLICT DO NOTHING).
+					raw_rows: List[Dict[str, Any]] = []
+					for r in raw_items:
+						key = make_dedup_key(getattr(r, "url", None), getattr(r, "title", None))
+						lang = detect_language_fast((getattr(r, "title", None) or "") + " " + (getattr(r, "url", None) or ""))
+						content = (getattr(r, "title", None) or "") + "|" + (getattr(r, "url", None) or "")
+						hash_val = hashlib.sha256(content.encode("utf-8", errors="ignore")).hexdigest()
+						raw_rows.append({
+							"source_id": (getattr(r, "source_id", None) or "demo"),
+							"url": getattr(r, "url", None),
+							"title": getattr(r, "title", None),
+							"published_at": getattr(r, "published_at", None),
+							"fetched_at": as_of,
+							"hash": hash_val,
+							"dedup_key": key,
+							"lang": lang,
+							"raw": None,
+						})
+					raw_ids = insert_ignore_returning(session, RawNews.__table__, raw_rows, ("source_id", "dedup_key"))
 
-				for n in norm_items:
-					nn = NormalizedNews(
-						raw_id=None,
-						source_id=n.source_id,
-						url=n.url,
-						title=n.title,
-						text=n.text,
-						published_at=n.published_at,
-						quality=n.quality,
-						entities_json=json.dumps(n.entities) if hasattr(n, "entities") and n.entities is not None else None,
-						content_hash=getattr(n, "content_hash", None),
-						link_canon_hash=getattr(n, "link_canon_hash", None),
-					)
-					session.add(nn)
-					session.commit()
-					session.refresh(nn)
+					# normalize() yields one item per raw item, in order: link each to its new raw id
+					norm_rows: List[Dict[str, Any]] = []
+					for i, n in enumerate(norm_items):
+						raw_row = raw_rows[i] if i < len(raw_rows) else None
+						norm_rows.append({
+							"raw_id": raw_ids.get((raw_row["source_id"], raw_row["dedup_key"])) if raw_row else None,
+							"source_id": n.source_id,
+							"url": n.url,
+							"title": n.title,
+							"text": n.text,
+							"published_at": n.published_at,
+							"quality": n.quality,
+							"entities_json": json.dumps(n.entities) if hasattr(n, "entities") and n.entities is not None else None,
+							"content_hash": getattr(n, "content_hash", None),
+							"link_canon_hash": getattr(n, "link_canon_hash", None),
+						})
+					bulk_insert(session, NormalizedNews.__table__, norm_rows)
 
-				# Persist scores and topN
-				nn_by_url = {n.url: n for n in session.exec(
-						NormalizedNews.__table__.select()
-					).all()}  # type: ignore
+					# Persist scores and topN
+					nn_by_url = {n.url: n for n in session.exec(
+							NormalizedNews.__table__.select()
+						).all()}  # type: ignore
 
-				# For simplicity: query latest normalized again to get IDs
-				all_nn = session.exec(
-					NormalizedNews.__table__.select()
-				).all()  # type: ignore
-				url_to_id = {}
-				for row in all_nn:
-					url_to_id[getattr(row, "url", None)] = getattr(row, "id", None)
+					# For simplicity: query latest normalized again to get IDs
+					all_nn = session.exec(
+						NormalizedNews.__table__.select()
+					).all()  # type: ignore
+					url_to_id = {}
+					for row in all_nn:
+						url_to_id[getattr(row, "url", None)] = getattr(row, "id", None)
 
-				ranked = []
-				for idx, s in enumerate(topn, start=1):
-					nid = url_to_id.get(s.normalized.url)
-					if not nid:
-						continue
-					# version from config if present
 					weight_version = str(cfg.get("scoring", {}).get("version", "v1.0.0"))
-					sc = Score(
-						normalized_id=nid,
-						relevance=s.components.get("relevance"),
-						sentiment_strength=s.components.get("sentiment_strength"),
-						event_weight=s.components.get("event_weight"),
-						recency=s.components.get("recency"),
-						source_trust=s.components.get("source_trust"),
-						total=s.total,
-						version=weight_version,
-					)
-					session.add(sc)
-					session.commit()
+					created_at = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+					score_rows: List[Dict[str, Any]] = []
+					tc_rows: List[Dict[str, Any]] = []
+					for idx, s in enumerate(topn, start=1):
+						nid = url_to_id.get(s.normalized.url)
+						if not nid:
+							continue
+						score_rows.append({
+							"normalized_id": nid,
+							"relevance": s.components.get("relevance"),
+							"sentiment_strength": s.components.get("sentiment_strength"),
+							"event_weight": s.components.get("event_weight"),
+							"recency": s.components.get("recency"),
+							"source_trust": s.components.get("source_trust"),
+							"total": s.total,
+							"version": weight_version,
+							"created_at": created_at,
+						})
+						tc_rows.append({
+							"trade_date": trade_date,
+							"market": market,
+							"normalized_id": nid,
+							"rank": idx,
+							"total_score": s.total,
+							"title": s.normalized.title,
+							"url": s.normalized.url,
+							"published_at": s.normalized.published_at,
+							"components_json": json.dumps(s.components),
+							"created_at": created_at,
+						})
+					bulk_insert(session, Score.__table__, score_rows)
+					bulk_insert(session, TopCandidate.__table__, tc_rows)
 
-					tc = TopCandidate(
-						trade_date=trade_date,
-						market=market,
-						normalized_id=nid,
-						rank=idx,
-						total_score=s.total,
-						title=s.normalized.title,
-						url=s.normalized.url,
-						published_at=s.normalized.published_at,
-						components_json=json.dumps(s.components),
-					)
-					session.add(tc)
+					# Plan based on top1 (if exists)
+					best = topn[0] if topn else None
+					_progress("Plan", 90)
+					plan_json, plan_md = generate_plan(best, market, trade_date)
+					# optional enrichment
+					try:
+						from .enricher import enrich_plan
+						plan_json, plan_md = enrich_plan(plan_json, plan_md, cfg)
+					except Exception:
+						pass
+					tp = TradePlan(trade_date=trade_date, market=market, plan_json=plan_json, plan_md=plan_md)
+					session.add(tp)
+					# single commit for the whole run
 					session.commit()
-					ranked.append(tc)
-
-				# Plan based on top1 (if exists)
-				best = topn[0] if topn else None
-				_progress("Plan", 90)
-				plan_json, plan_md = generate_plan(best, market, trade_date)
-				# optional enrichment
-				try:
-					from .enricher import enrich_plan
-					plan_json, plan_md = enrich_plan(plan_json, plan_md, cfg)
-				except Exception:
-					pass
-				tp = TradePlan(trade_date=trade_date, market=market, plan_json=plan_json, plan_md=plan_md)
-				session.add(tp)
-				session.commit()
+			finally:
+				# Record the run even if persistence failed; persist is reported as its own stage
+				if run_metrics is not None:
+					run_metrics["timings_ms"]["persist"] = int((time.time() - t_persist0) * 1000)
+					run_metrics["counts"]["raw_inserted"] = len(raw_ids)
+					try:
+						record_run(run_metrics)
+					except Exception:
+						pass
 		except Exception:
 			# Keep API responsive even if minimal pipeline fails
 			pass
@@ -0,0 +1,201 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+import re
+import threading
+
+import yaml
+
+# Keyword rule engine shared by the scorer, the API signal extraction and the intraday watcher.
+# Dictionaries map category -> label -> keywords. A keyword ending in '*' is a prefix
+# (e.g. 'warn*' matches 'warning'). Single latin words are matched as whole tokens via a
+# dict lookup; CJK keywords and multi-word phrases are compiled into one alternation.
+# Both are resolved in one scan of the title.
+
+DEFAULT_RULES: Dict[str, Dict[str, List[str]]] = {
+	"events": {
+		"earnings": ["earnings", "results", "profit", "beat", "业绩", "财报", "净利润", "盈利"],
+		"contract": ["contract", "order", "deal", "award", "合同", "中标", "订单"],
+		"m&a": ["merger", "acquisition", "m&a", "takeover", "并购", "收购", "重组"],
+		"guidance": ["guidance", "forecast", "outlook", "业绩预告", "指引", "展望"],
+	},
+	"sentiment": {
+		"positive": [
+			"surge", "surges", "surged",
+			"rise", "rises", "rose",
+			"up",
+			"beat", "beats", "beating",
+			"win", "wins", "winning",
+			"strong", "strengthens", "rally", "rallies",
+			"上涨", "大涨", "涨停", "利好", "增长",
+		],
+		"negative": [
+			"fall", "falls", "fell",
+			"down",
+			"miss", "misses", "missed",
+			"loss", "losses",
+			"weak", "weakness",
+			"plunge", "plunges", "plunged",
+			"plummet", "plummets",
+			"drop", "drops", "dropped",
+			"slump", "slumps", "slumped",
+			"下跌", "大跌", "跌停", "亏损", "利空",
+		],
+	},
+	"alerts": {
+		"negative": ["down", "fall", "loss", "warn*", "监管", "处罚", "罚款", "预警", "下跌", "亏损"],
+	},
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:&[a-z0-9]+)*")
+_SINGLE_TOKEN_RE = re.compile(r"^[a-z0-9]+(?:&[a-z0-9]+)*\*?$")
+
+
+@dataclass
+class RuleHits:
+	# category -> labels hit, in dictionary order, de-duplicated
+	labels: Dict[str, List[str]] = field(default_factory=dict)
+
+	def get(self, category: str) -> List[str]:
+		return self.labels.get(category, [])
+
+	def has(self, category: str, label: Optional[str] = None) -> bool:
+		hit = self.labels.get(category) or []
+		return bool(hit) if label is None else label in hit
+
+
+class RuleEngine:
+	"""Compiled multi-pattern keyword matcher over category/label dictionaries."""
+
+	def __init__(self, rules: Dict[str, Dict[str, List[str]]]) -> None:
+		self.rules = rules
+		# label order per category, used to keep output stable
+		self._order: Dict[str, Dict[str, int]] = {}
+		self._tokens: Dict[str, List[Tuple[str, str]]] = {}
+		self._prefixes: Dict[str, List[Tuple[str, str]]] = {}
+		self._phrases: Dict[str, List[Tuple[str, str]]] = {}
+		for cat, labels in rules.items():
+			self._order[cat] = {}
+			for label, words in (labels or {}).items():
+				self._order[cat].setdefault(label, len(self._order[cat]))
+				for w in words or []:
+					kw = str(w).strip().lower()
+					if not kw:
+						continue
+					if _SINGLE_TOKEN_RE.match(kw):
+						if kw.endswith("*"):
+							self._prefixes.setdefault(kw[:-1], []).append((cat, label))
+						else:
+							self._tokens.setdefault(kw, []).append((cat, label))
+					else:
+						self._phrases.setdefault(kw, []).append((cat, label))
+		self._prefix_tuple = tuple(sorted(self._prefixes, key=len, reverse=True))
+		# Longest phrases first so the alternation prefers the most specific match
+		phrases = sorted(self._phrases, key=lambda k: (-len(k), k))
+		self._phrase_re: Optional[re.Pattern[str]] = re.compile("|".join(re.escape(p) for p in phrases)) if phrases else None
+
+	def match(self, text: Optional[str]) -> RuleHits:
+		if not text:
+			return RuleHits()
+		low = text.lower()
+		found: Dict[str, set] = {}
+		tokens = self._tokens
+		prefixes = self._prefix_tuple
+		for tok in _TOKEN_RE.findall(low):
+			hit = tokens.get(tok)
+			if hit is None and prefixes and tok.startswith(prefixes):
+				hit = next(self._prefixes[p] for p in prefixes if tok.startswith(p))
+			if hit:
+				for cat, label in hit:
+					found.setdefault(cat, set()).add(label)
+		if self._phrase_re is not None:
+			for phrase in self._phrase_re.findall(low):
+				for cat, label in self._phrases.get(phrase, []):
+					found.setdefault(cat, set()).add(label)
+		labels = {
+			cat: sorted(hit, key=lambda lb, _o=self._order.get(cat, {}): _o.get(lb, 0))
+			for cat, hit in found.items()
+		}
+		return RuleHits(labels=labels)
+
+
+_ENGINE_LOCK = threading.Lock()
+_ENGINE: Optional[RuleEngine] = None
+
+
+def _config_dir() -> Path:
+	return Path(__file__).resolve().parents[1] / "config"
+
+
+def load_rule_dict(path: Optional[Path] = None) -> Dict[str, Dict[str, List[str]]]:
+	"""Return DEFAULT_RULES merged with config/rules.yaml (if present).
+	Labels listed in YAML replace the built-in keyword list for that label.
+	"""
+	rules: Dict[str, Dict[str, List[str]]] = {cat: dict(labels) for cat, labels in DEFAULT_RULES.items()}
+	p = path or (_config_dir() / "rules.yaml")
+	try:
+		if not p.exists():
+			return rules
+		with p.open("r", encoding="utf-8") as f:
+			data: Any = yaml.safe_load(f) or {}
+	except Exception:
+		return rules
+	if not isinstance(data, dict):
+		return rules
+	for cat, labels in data.items():
+		if not isinstance(labels, dict):
+			continue
+		dst = rules.setdefault(str(cat), {})
+		for label, words in labels.items():
+			if isinstance(words, str):
+				words = [words]
+			if isinstance(words, list):
+				dst[str(label)] = [w for w in words if isinstance(w, str) and w.strip()]
+	return rules
+
+
+def get_engine() -> RuleEngine:
+	global _ENGINE
+	engine = _ENGINE
+	if engine is not None:
+		return engine
+	with _ENGINE_LOCK:
+		if _ENGINE is None:
+			_ENGINE = RuleEngine(load_rule_dict())
+		return _ENGINE
+
+
+def reset_engine() -> None:
+	"""Drop the compiled engine so the next call reloads dictionaries (for tests/config reloads)."""
+	global _ENGINE
+	with _ENGINE_LOCK:
+		_ENGINE = None
+
+
+def events_and_sentiment(title: Optional[str]) -> Tuple[List[str], str]:
+	hits = get_engine().match(title)
+	if hits.has("sentiment", "positive"):
+		sent = "positive"
+	elif hits.has("sentiment", "negative"):
+		sent = "negative"
+	else:
+		sent = "neutral"
+	return hits.get("events"), sent
+
+
+def rule_scores(title: Optional[str]) -> Tuple[float, float]:
+	"""Return (event_weight, sentiment_strength) from keyword hits."""
+	hits = get_engine().match(title)
+	event_weight = 0.8 if hits.has("events") else 0.5
+	if hits.has("sentiment", "positive"):
+		sentiment_strength = 0.6
+	elif hits.has("sentiment", "negative"):
+		sentiment_strength = 0.4
+	else:
+		sentiment_strength = 0.5
+	return event_weight, sentiment_strength
+
+
+def is_negative_alert(title: Optional[str]) -> bool:
+	return get_engine().match(title).has("alerts", "negative")
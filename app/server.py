@@ -33,11 +33,12 @@ import re
 import httpx
 # LLM cache and metrics
 try:
-	from .llm_cache import make_cache_key, cache_get, cache_put
+	from .llm_cache import make_cache_key, cache_get, cache_put, single_flight
 except Exception:  # pragma: no cover
 	make_cache_key = None
 	cache_get = None
 	cache_put = None
+	single_flight = None
 try:
 	from .metrics import record_llm_call
 except Exception:  # pragma: no cover
@@ -300,46 +301,9 @@ def _stop_scheduler() -> None:
 
 
 def _extract_events_and_sentiment(title: Optional[str]) -> tuple[List[str], Optional[str]]:
-	t = (title or "").lower()
-	events: List[str] = []
-	if any(k in t for k in ("earnings", "results", "profit", "beat")):
-		events.append("earnings")
-	if any(k in t for k in ("contract", "order", "deal", "award")):
-		events.append("contract")
-	if any(k in t for k in ("merger", "acquisition", "m&a", "takeover")):
-		events.append("m&a")
-	if any(k in t for k in ("guidance", "forecast", "outlook")):
-		events.append("guidance")
-	# sentiment (use word-boundary regex to avoid substring false-positives like 'startup'/'update')
-	pos_words = (
-		"surge", "surges", "surged",
-		"rise", "rises", "rose",
-		"up",
-		"beat", "beats", "beating",
-		"win", "wins", "winning",
-		"strong", "strengthens", "rally", "rallies",
-	)
-	neg_words = (
-		"fall", "falls", "fell",
-		"down",
-		"miss", "misses", "missed",
-		"loss", "losses",
-		"weak", "weakness",
-		"plunge", "plunges", "plunged",
-		"plummet", "plummets",
-		"drop", "drops", "dropped",
-		"slump", "slumps", "slumped",
-	)
-	def _matches_any(text: str, words: tuple[str, ...]) -> bool:
-		pattern = r"\b(?:%s)\b" % "|".join(re.escape(w) for w in words)
-		return re.search(pattern, text) is not None
-	if _matches_any(t, pos_words):
-		sent = "positive"
-	elif _matches_any(t, neg_words):
-		sent = "negative"
-	else:
-		sent = "neutral"
-	return events, sent
+	# Shared compiled rule engine (word-boundary EN + CJK dictionaries, one pass)
+	from .rules import events_and_sentiment
+	return events_and_sentiment(title)
 
 
 def _infer_symbol_code(norm: Optional["NormalizedNews"]) -> Optional[str]:
@@ -433,9 +397,10 @@ def _call_deepseek(messages: List[Dict[str, Any]], temperature: float, max_token
 				return answer or "", model, usage
 		except Exception:
 			pass
-	try:
+	timeout_ms = int(cfg.get("timeout_ms") or 12000)
+
+	def _upstream() -> tuple[str, Optional[str], Optional[Dict[str, Any]]]:
 		t0 = perf_counter()
-		timeout_ms = int(cfg.get("timeout_ms") or 12000)
 		with httpx.Client(timeout=timeout_ms / 1000.0) as client:
 			r = client.post(url, headers={"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}, json=payload)
 			dur_ms = int((perf_counter() - t0) * 1000)
@@ -458,8 +423,21 @@ def _call_deepseek(messages: List[Dict[str, Any]], temperature: float, max_token
 				except Exception:
 					pass
 			return answer, model, usage
+
+	try:
+		if cache_key and single_flight:
+			# Coalesce concurrent identical prompts into one upstream call
+			t_wait = perf_counter()
+			(answer, model, usage), coalesced = single_flight(cache_key, _upstream, timeout_s=timeout_ms / 1000.0)
+			if coalesced:
+				record_llm_call("success", int((perf_counter() - t_wait) * 1000), False, coalesced=True)
+			return answer, model, usage
+		return _upstream()
 	except HTTPException:
 		raise
+	except TimeoutError as e:
+		record_llm_call("failure", timeout_ms, False, coalesced=True)
+		raise HTTPException(status_code=504, detail=f"DeepSeek request timed out: {e}")
 	except Exception as e:
 		record_llm_call("failure", 0, False)
 		raise HTTPException(status_code=502, detail=f"DeepSeek request failed: {e}")
@@ -1,2 +1,3 @@
 from .db import init_db, get_session  # noqa: F401
-from .models import RawNews, NormalizedNews, Score, TopCandidate, TradePlan  # noqa: F401 
\ No newline at end of file
+from .models import RawNews, NormalizedNews, Score, TopCandidate, TradePlan  # noqa: F401
+from .bulk import bulk_insert, insert_ignore_returning, rows_from  # noqa: F401
@@ -0,0 +1,85 @@
+from __future__ import annotations
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, insert, select, tuple_
+from sqlmodel import Session
+
+# Bulk persistence helpers: multi-row INSERTs executed inside the caller's transaction
+# (no per-row commit/refresh). SQLite caps bound parameters per statement, so rows are
+# sent in chunks.
+
+_CHUNK_ROWS = 500
+
+
+def _chunks(rows: Sequence[Dict[str, Any]], size: int) -> Iterator[Sequence[Dict[str, Any]]]:
+	for i in range(0, len(rows), size):
+		yield rows[i:i + size]
+
+
+def _dialect_insert(session: Session, table: Table) -> Any:
+	name = session.get_bind().dialect.name
+	if name == "sqlite":
+		from sqlalchemy.dialects.sqlite import insert as _ins
+		return _ins(table)
+	if name == "postgresql":
+		from sqlalchemy.dialects.postgresql import insert as _ins
+		return _ins(table)
+	return None
+
+
+def bulk_insert(session: Session, table: Table, rows: Sequence[Dict[str, Any]]) -> int:
+	"""Insert rows with multi-row VALUES statements; returns the number of rows sent."""
+	if not rows:
+		return 0
+	conn = session.connection()
+	for chunk in _chunks(rows, _CHUNK_ROWS):
+		conn.execute(insert(table), list(chunk))
+	return len(rows)
+
+
+def insert_ignore_returning(
+	session: Session,
+	table: Table,
+	rows: Sequence[Dict[str, Any]],
+	conflict_cols: Sequence[str],
+) -> Dict[Tuple[Any, ...], int]:
+	"""INSERT ... ON CONFLICT DO NOTHING, returning {conflict key tuple: new id} for inserted rows.
+	Rows that hit the unique index are skipped and absent from the result.
+	"""
+	out: Dict[Tuple[Any, ...], int] = {}
+	if not rows:
+		return out
+	key_cols = [table.c[c] for c in conflict_cols]
+	conn = session.connection()
+	base = _dialect_insert(session, table)
+	if base is None:
+		# Portable fallback: one set-based existence check per chunk, then plain insert
+		for chunk in _chunks(rows, _CHUNK_ROWS):
+			keys = [tuple(r.get(c) for c in conflict_cols) for r in chunk]
+			existing = {tuple(row) for row in conn.execute(select(*key_cols).where(tuple_(*key_cols).in_(keys)))}
+			fresh = [r for r, k in zip(chunk, keys) if k not in existing]
+			for r in fresh:
+				res = conn.execute(insert(table).values(**r))
+				pk = res.inserted_primary_key
+				if pk:
+					out[tuple(r.get(c) for c in conflict_cols)] = int(pk[0])
+		return out
+	for chunk in _chunks(rows, _CHUNK_ROWS):
+		stmt = (
+			base.values(list(chunk))
+			.on_conflict_do_nothing(index_elements=list(conflict_cols))
+			.returning(table.c.id, *key_cols)
+		)
+		for row in conn.execute(stmt):
+			out[tuple(row[1:])] = int(row[0])
+	return out
+
+
+def rows_from(objs: Iterable[Any], exclude: Optional[Iterable[str]] = ("id",)) -> List[Dict[str, Any]]:
+	"""Convert SQLModel instances into column dicts suitable for bulk_insert (defaults applied)."""
+	skip = set(exclude or ())
+	out: List[Dict[str, Any]] = []
+	for o in objs:
+		table: Table = o.__table__
+		out.append({c.name: getattr(o, c.name) for c in table.columns if c.name not in skip})
+	return out
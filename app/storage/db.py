@@ -56,6 +56,16 @@ def init_db() -> None:
 					conn.exec_driver_sql("ALTER TABLE normalizednews ADD COLUMN content_hash TEXT")
 				if "link_canon_hash" not in cols:
 					conn.exec_driver_sql("ALTER TABLE normalizednews ADD COLUMN link_canon_hash TEXT")
+				# rawnews: unique (source_id, dedup_key) for ON CONFLICT dedup; drop legacy duplicates first
+				res = conn.exec_driver_sql("PRAGMA index_list('rawnews')")
+				if "ux_rawnews_source_dedup" not in {str(r[1]) for r in res.fetchall()}:  # type: ignore
+					conn.exec_driver_sql(
+						"DELETE FROM rawnews WHERE id NOT IN (SELECT MIN(id) FROM rawnews GROUP BY source_id, dedup_key)"
+					)
+					conn.exec_driver_sql(
+						"CREATE UNIQUE INDEX IF NOT EXISTS ux_rawnews_source_dedup ON rawnews (source_id, dedup_key)"
+					)
+				conn.commit()
 	except Exception:
 		# Best-effort; ignore migration errors to avoid breaking startup
 		pass
@@ -2,9 +2,13 @@ from __future__ import annotations
 from typing import Optional, Dict, Any, List
 from datetime import datetime, timezone
 from sqlmodel import SQLModel, Field, select
+from sqlalchemy import Index
 
 
 class RawNews(SQLModel, table=True):
+    # Dedup is enforced by the database: bulk inserts use ON CONFLICT DO NOTHING on this index
+    __table_args__ = (Index("ux_rawnews_source_dedup", "source_id", "dedup_key", unique=True),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     source_id: str
     url: Optional[str] = None
@@ -4,19 +4,12 @@ import hashlib
 import json
 import time
 
-from .llm_cache import cache_get, cache_set
+from .llm_cache import cache_get, cache_set, single_flight
+from .rules import rule_scores
 
 
 def _simple_rules(title: str) -> Tuple[float, float]:
-	t = (title or "").lower()
-	event_weight = 0.8 if any(k in t for k in ("earnings", "contract", "merger", "m&a")) else 0.5
-	if any(k in t for k in ("up", "surge", "beat", "win")):
-		sentiment_strength = 0.6
-	elif any(k in t for k in ("down", "fall", "miss", "loss")):
-		sentiment_strength = 0.4
-	else:
-		sentiment_strength = 0.5
-	return event_weight, sentiment_strength
+	return rule_scores(title)
 
 
 def _content_hash(text: str) -> str:
@@ -92,17 +85,28 @@ def tag_with_fallback(title: str, cfg: Dict[str, Any]) -> Tuple[float, float, Di
 	api_key = llm_cfg.get("api_key")
 	base_url = llm_cfg.get("base_url") or "https://api.deepseek.com"
 	timeout_ms = int(llm_cfg.get("timeout_ms") or 12000)
-	resp = _call_deepseek_json(title, timeout_ms=timeout_ms, base_url=base_url, api_key=api_key)
+	# Syndicated titles often arrive concurrently; only one caller per key goes upstream
+	coalesced = False
+	try:
+		resp, coalesced = single_flight(
+			key,
+			lambda: _call_deepseek_json(title, timeout_ms=timeout_ms, base_url=base_url, api_key=api_key),
+			timeout_s=max(1.0, timeout_ms / 1000.0),
+		)
+	except Exception:
+		resp = None
 	if isinstance(resp, dict):
 		try:
 			evt = float(resp.get("event_weight", 0.5))
 			sent = float(resp.get("sentiment_strength", 0.5))
-			# cache
-			cache_set(key, {"event_weight": evt, "sentiment_strength": sent}, ttl_seconds=cache_ttl_seconds)
+			# cache (leader only; followers share the leader's entry)
+			if not coalesced:
+				cache_set(key, {"event_weight": evt, "sentiment_strength": sent}, ttl_seconds=cache_ttl_seconds)
+			meta["coalesced"] = coalesced
 			# metrics
 			try:
 				from .metrics import record_llm_call
-				record_llm_call(outcome="success", duration_ms=int((time.time() - start) * 1000), cache_hit=False)
+				record_llm_call(outcome="success", duration_ms=int((time.time() - start) * 1000), cache_hit=False, coalesced=coalesced)
 			except Exception:
 				pass
 			return evt, sent, meta
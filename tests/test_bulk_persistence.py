@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from sqlmodel import select
+
+from app.metrics import reset as metrics_reset, snapshot
+from app.models import DeadlinesSpec
+from app.pipeline import components
+from app.pipeline.components import RawItem
+from app.pipeline.preopen import PreOpenPipeline
+from app.storage import RawNews, NormalizedNews, TopCandidate, get_session, init_db, insert_ignore_returning
+
+
+def _raw_row(source_id: str, key: str) -> dict:
+	return {"source_id": source_id, "url": key, "title": key, "published_at": None, "fetched_at": None,
+		"hash": None, "dedup_key": key, "lang": "en", "raw": None}
+
+
+def test_insert_ignore_returning_skips_conflicts_and_maps_ids():
+	init_db()
+	with get_session() as session:
+		first = insert_ignore_returning(session, RawNews.__table__, [_raw_row("bulk_t", "a"), _raw_row("bulk_t", "b")], ("source_id", "dedup_key"))
+		second = insert_ignore_returning(session, RawNews.__table__, [_raw_row("bulk_t", "b"), _raw_row("bulk_t", "c")], ("source_id", "dedup_key"))
+		session.commit()
+		assert set(first) == {("bulk_t", "a"), ("bulk_t", "b")}
+		assert set(second) == {("bulk_t", "c")}
+		rows = session.exec(select(RawNews).where(RawNews.source_id == "bulk_t")).all()
+		assert {r.dedup_key: r.id for r in rows} == {"a": first[("bulk_t", "a")], "b": first[("bulk_t", "b")], "c": second[("bulk_t", "c")]}
+
+
+def test_pipeline_persists_in_bulk_and_reports_persist_stage(monkeypatch):
+	init_db()
+	metrics_reset()
+	items = [
+		RawItem(source_id="rss_bulk", url=f"https://bulk.test/{i}", title=f"Bulk earnings beat {i}", published_at="2025-09-15T07:30:00Z")
+		for i in range(20)
+	]
+	monkeypatch.setattr(components, "fetch_from_all_sources", lambda cfg, market, trade_date: list(items))
+	spec = DeadlinesSpec()
+	PreOpenPipeline.run("SSE", "2025-09-15", spec)
+	PreOpenPipeline.run("SSE", "2025-09-15", spec)
+
+	with get_session() as session:
+		raws = session.exec(select(RawNews).where(RawNews.source_id == "rss_bulk")).all()
+		assert len(raws) == 20  # second run deduped by the unique index
+		norms = session.exec(select(NormalizedNews).where(NormalizedNews.source_id == "rss_bulk")).all()
+		raw_ids = {r.id for r in raws}
+		assert sum(1 for n in norms if n.raw_id in raw_ids) == 20
+		tcs = session.exec(select(TopCandidate).where(TopCandidate.trade_date == "2025-09-15")).all()
+		assert len(tcs) >= 10
+
+	last = snapshot()
+	assert "persist" in (last.get("last_timings_ms") or {})
+	assert last["last_counts"]["raw_inserted"] == 0
@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from app import tagger
+from app.llm_cache import cache_clear, cache_stats, single_flight
+from app.metrics import reset as metrics_reset, snapshot
+
+
+@pytest.fixture(autouse=True)
+def _clean_state():
+	metrics_reset()
+	cache_clear()
+	yield
+	metrics_reset()
+	cache_clear()
+
+
+def _run_concurrently(n, target):
+	results = []
+	lock = threading.Lock()
+	def _worker():
+		try:
+			out = target()
+		except Exception as e:  # collect failures too
+			out = e
+		with lock:
+			results.append(out)
+	threads = [threading.Thread(target=_worker) for _ in range(n)]
+	for t in threads:
+		t.start()
+	for t in threads:
+		t.join()
+	return results
+
+
+def test_single_flight_runs_once_and_shares_result():
+	calls = {"n": 0}
+	def slow():
+		calls["n"] += 1
+		time.sleep(0.2)
+		return "answer"
+	results = _run_concurrently(5, lambda: single_flight("k1", slow, timeout_s=2.0))
+	assert calls["n"] == 1
+	assert all(r[0] == "answer" for r in results)
+	assert sum(1 for r in results if r[1]) == 4
+	assert cache_stats()["coalesced"] == 4
+	assert cache_stats()["inflight"] == 0
+
+
+def test_single_flight_propagates_failure_to_waiters():
+	def boom():
+		time.sleep(0.2)
+		raise ValueError("upstream down")
+	results = _run_concurrently(3, lambda: single_flight("k2", boom, timeout_s=2.0))
+	assert len(results) == 3
+	assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_single_flight_follower_times_out_independently():
+	started = threading.Event()
+	def slow():
+		started.set()
+		time.sleep(0.5)
+		return 1
+	leader = threading.Thread(target=lambda: single_flight("k3", slow))
+	leader.start()
+	started.wait(1.0)
+	with pytest.raises(TimeoutError):
+		single_flight("k3", slow, timeout_s=0.05)
+	leader.join()
+
+
+def test_tagger_coalesces_concurrent_titles(monkeypatch):
+	calls = {"n": 0}
+	def fake_call(prompt, timeout_ms, base_url, api_key):
+		calls["n"] += 1
+		time.sleep(0.2)
+		return {"event_weight": 0.8, "sentiment_strength": 0.6}
+	monkeypatch.setattr(tagger, "_call_deepseek_json", fake_call)
+	cfg = {"llm": {"tagger_enabled": True, "prompt_version": "sf", "api_key": "dummy", "timeout_ms": 2000}}
+	results = _run_concurrently(4, lambda: tagger.tag_with_fallback("Syndicated earnings beat", cfg))
+	assert calls["n"] == 1
+	assert all(r[0] == 0.8 for r in results)
+	llm = snapshot()["llm"]
+	assert llm["calls"] == 4
+	assert llm["coalesced"] == 3
+	assert llm["cache_hits"] == 0
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.rules import RuleEngine, events_and_sentiment, is_negative_alert, load_rule_dict, rule_scores
+
+
+def test_single_pass_returns_all_event_and_sentiment_hits():
+	engine = RuleEngine(load_rule_dict())
+	hits = engine.match("Company wins contract; earnings beat and merger talks")
+	assert hits.get("events") == ["earnings", "contract", "m&a"]
+	assert hits.has("sentiment", "positive")
+
+
+def test_word_boundaries_avoid_substring_false_positives():
+	# 'update'/'startup' must not count as 'up'
+	assert events_and_sentiment("Startup ships update") == ([], "neutral")
+	assert rule_scores("Startup ships update") == (0.5, 0.5)
+
+
+def test_cjk_keywords_and_prefix_patterns():
+	events, sent = events_and_sentiment("贵州茅台业绩大涨")
+	assert "earnings" in events
+	assert sent == "positive"
+	assert is_negative_alert("Regulator warns lender")
+	assert is_negative_alert("公司收到监管处罚")
+	assert not is_negative_alert("Shares rally")
+
+
+def test_rules_yaml_overrides_labels(tmp_path):
+	p = tmp_path / "rules.yaml"
+	p.write_text("events:\n  recall: [recall, 召回]\nsentiment:\n  positive: [moon]\n", encoding="utf-8")
+	engine = RuleEngine(load_rule_dict(p))
+	hits = engine.match("Automaker recall sends stock to the moon")
+	assert hits.get("events") == ["recall"]
+	assert hits.get("sentiment") == ["positive"]
+	# replaced label no longer matches built-in words
+	assert not engine.match("shares surge").has("sentiment", "positive")